@@ -1,17 +1,29 @@
 ```python
-import sys
 import os
-from flask import Flask, render_template_string, jsonify
+import re
+import hashlib
+import threading
+from typing import Any, Dict, Optional, Union
 
-# Add the project root to the Python path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from flask import Flask, request
 
 from simulator import simulate
+from simulator.serialization import dumps
+
+try:
+    from flask_compress import Compress
+except ImportError:  # pragma: no cover - compression is optional
+    Compress = None
 
 app = Flask(__name__)
 
-# Run simulation once on startup
-RESULTS = simulate.simulate()
+# The routes payload grows quadratically with fabric size and is highly
+# repetitive, so gzip JSON and HTML responses when Flask-Compress is available.
+app.config["COMPRESS_MIMETYPES"] = ["application/json", "text/html"]
+app.config["COMPRESS_LEVEL"] = 6
+app.config["COMPRESS_MIN_SIZE"] = 1024
+if Compress is not None:
+    Compress(app)
 
 HTML_TEMPLATE = """
 <!DOCTYPE html>
@@ -114,36 +126,154 @@ HTML_TEMPLATE = """
 """
 
 
+def _minify_template(template: str) -> str:
+    """
+    Strips presentational whitespace from the dashboard template.
+
+    The <style> block is collapsed onto a single line. Elsewhere only line
+    indentation and blank lines are removed: line breaks are kept so the
+    inline script's // comments stay terminated and the Jinja expressions
+    are left untouched.
+
+    Args:
+        template: Jinja template source
+
+    Returns:
+        The minified template source
+    """
+    def minify_css(match: re.Match) -> str:
+        css = re.sub(r"\s+", " ", match.group(2))
+        css = re.sub(r"\s*([{}:;,])\s*", r"\1", css)
+        css = css.replace(";}", "}")
+        return match.group(1) + css.strip() + match.group(3)
+
+    template = re.sub(r"(<style>)(.*?)(</style>)", minify_css, template, flags=re.S)
+    return re.sub(r"\n\s+", "\n", template).strip()
+
+
+# Minify and compile the template once; render_template_string re-parses on
+# every call. Using the app's environment keeps Flask's tojson filter and
+# autoescaping.
+DASHBOARD_TEMPLATE = app.jinja_env.from_string(_minify_template(HTML_TEMPLATE))
+
+
+# Serialized payloads, built on first use by _get_payloads()
+_PAYLOADS: Optional[Dict[str, Any]] = None
+_PAYLOADS_LOCK = threading.Lock()
+
+# Results are fixed for the life of the process, so clients may reuse a
+# response for this long and revalidate with its ETag afterwards
+CACHE_MAX_AGE = 3600
+
+
+def _get_payloads() -> Dict[str, Any]:
+    """
+    Runs the simulation on first use and caches its serialized output.
+
+    The results never change once computed, so every payload is encoded and
+    the dashboard rendered exactly once. The lock keeps concurrent first
+    requests under a threaded server from simulating more than once.
+
+    Returns:
+        Dict with "topology", "routes" and "vxlan" JSON bytes, the rendered
+        "dashboard" HTML, and an "etags" dict keyed the same way.
+    """
+    global _PAYLOADS
+    if _PAYLOADS is None:
+        with _PAYLOADS_LOCK:
+            if _PAYLOADS is None:
+                results = simulate.simulate()
+                with app.app_context():
+                    dashboard_html = DASHBOARD_TEMPLATE.render(
+                        topology=results.get("topology", {}),
+                        routes=results.get("routes", []),
+                        vxlan=results.get("vxlan", {})
+                    )
+                payloads = {
+                    "topology": dumps(results.get("topology", {})),
+                    "routes": dumps(results.get("routes", [])),
+                    "vxlan": dumps(results.get("vxlan", {})),
+                    "dashboard": dashboard_html,
+                }
+                payloads["etags"] = {
+                    "topology": hashlib.sha1(payloads["topology"]).hexdigest(),
+                    "routes": hashlib.sha1(payloads["routes"]).hexdigest(),
+                    "vxlan": hashlib.sha1(payloads["vxlan"]).hexdigest(),
+                    "dashboard": hashlib.sha1(dashboard_html.encode("utf-8")).hexdigest(),
+                }
+                _PAYLOADS = payloads
+    return _PAYLOADS
+
+
+def warm_cache() -> None:
+    """Computes the cached payloads ahead of the first request."""
+    _get_payloads()
+
+
+def _cached_response(
+    body: Union[str, bytes],
+    etag: str,
+    mimetype: str = "application/json"
+):
+    """
+    Builds a publicly cacheable response for an immutable payload.
+
+    The ETag is weak because the same payload may be sent gzip-encoded or
+    not. A request whose If-None-Match matches gets an empty 304 without the
+    body being touched.
+
+    Args:
+        body: Pre-serialized payload
+        etag: ETag value identifying the payload
+        mimetype: Response MIME type (default: application/json)
+
+    Returns:
+        A 200 response carrying the body, or a 304 Not Modified
+    """
+    if request.if_none_match.contains_weak(etag):
+        response = app.response_class(status=304, mimetype=mimetype)
+    else:
+        response = app.response_class(body, mimetype=mimetype)
+    response.set_etag(etag, weak=True)
+    response.cache_control.public = True
+    response.cache_control.max_age = CACHE_MAX_AGE
+    return response
+
+
 @app.route("/")
 def dashboard():
-    """Renders the main dashboard with simulation results."""
-    return render_template_string(
-        HTML_TEMPLATE,
-        topology=RESULTS.get("topology", {}),
-        routes=RESULTS.get("routes", {}),
-        vxlan=RESULTS.get("vxlan", {})
+    """Returns the pre-rendered dashboard with simulation results."""
+    payloads = _get_payloads()
+    return _cached_response(
+        payloads["dashboard"], payloads["etags"]["dashboard"], mimetype="text/html"
     )
 
 
 @app.route("/api/topology")
 def api_topology():
     """Returns the network topology as JSON."""
-    return jsonify(RESULTS.get("topology", {}))
+    payloads = _get_payloads()
+    return _cached_response(payloads["topology"], payloads["etags"]["topology"])
 
 
 @app.route("/api/routes")
 def api_routes():
     """Returns the routing tables as JSON."""
-    return jsonify(RESULTS.get("routes", {}))
+    payloads = _get_payloads()
+    return _cached_response(payloads["routes"], payloads["etags"]["routes"])
 
 
 @app.route("/api/vxlan")
 def api_vxlan():
     """Returns the VXLAN configuration as JSON."""
-    return jsonify(RESULTS.get("vxlan", {}))
+    payloads = _get_payloads()
+    return _cached_response(payloads["vxlan"], payloads["etags"]["vxlan"])
 
 
 if __name__ == "__main__":
     print("Starting Flask server at http://127.0.0.1:5000")
-    app.run(debug=True, host="127.0.0.1", port=5000)
+    # Development server for local use only; see README for production serving.
+    # Set FLASK_DEBUG=1 to enable the debugger and reloader.
+    debug = os.environ.get("FLASK_DEBUG") == "1"
+    app.run(debug=debug, host="127.0.0.1", port=5000)
 ```
\ No newline at end of file
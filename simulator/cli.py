@@ -1,13 +1,9 @@
 ```python
-import json
-import os
 import sys
 import traceback
 
-# Add the project root to the Python path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
 from simulator import simulate
+from simulator.serialization import dumps
 
 
 def main():
@@ -26,8 +22,11 @@ def main():
     try:
         results = simulate.simulate()
         
-        # Pretty-print the JSON output
-        print(json.dumps(results, indent=2))
+        # Pretty-print the JSON output, writing the encoded bytes directly
+        sys.stdout.flush()
+        sys.stdout.buffer.write(dumps(results, indent=True))
+        sys.stdout.buffer.write(b"\n")
+        sys.stdout.buffer.flush()
         print("\nSimulation complete. Run 'python -m simulator.api' to see the dashboard.")
         
         return 0
@@ -1,9 +1,17 @@
 ```python
 from __future__ import annotations
-from typing import TYPE_CHECKING, Dict, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
 
 import networkx as nx
 
+try:
+    import numpy as np
+    from scipy.sparse import csr_matrix
+    from scipy.sparse.csgraph import dijkstra
+except ImportError:  # pragma: no cover - SciPy is optional
+    csr_matrix = None
+
 if TYPE_CHECKING:
     from .topology import Fabric
 
@@ -23,33 +31,187 @@ def compute_spf_for_node(graph: nx.Graph, start_node: str) -> Dict[str, Tuple[st
     if start_node not in graph:
         return {}
 
-    # Compute shortest paths and costs using Dijkstra's algorithm
-    paths = nx.single_source_dijkstra_path(graph, start_node, weight="cost")
-    costs = nx.single_source_dijkstra_path_length(graph, start_node, weight="cost")
+    # One Dijkstra pass yields predecessors and costs; full paths are never
+    # materialized since only the first hop is needed
+    pred, costs = nx.dijkstra_predecessor_and_distance(graph, start_node, weight="cost")
 
     routing_table = {}
-    for dest, path in paths.items():
+    next_hops = {}
+    # Distances are recorded in settle order, so a destination's predecessor
+    # always has its next hop resolved first
+    for dest, cost in costs.items():
         # Skip the source node itself
         if start_node == dest:
             continue
 
-        # Determine next hop: second node in path for multi-hop, or destination if directly connected
-        next_hop = path[1] if len(path) > 1 else dest
-        routing_table[dest] = (next_hop, costs[dest])
+        # Directly connected destinations are their own next hop; otherwise
+        # inherit the next hop of the predecessor on the shortest path
+        parent = pred[dest][0]
+        next_hop = dest if parent == start_node else next_hops[parent]
+        next_hops[dest] = next_hop
+        routing_table[dest] = (next_hop, cost)
 
     return routing_table
 
 
-def install_routes_for_all(graph: nx.Graph) -> Dict[str, Dict[str, Tuple[str, int]]]:
+def _install_routes_csgraph(graph: nx.Graph) -> Optional[Dict[str, Dict[str, Tuple[str, int]]]]:
+    """
+    Computes all-pairs SPF with a single SciPy sparse-graph Dijkstra call.
+
+    Only positive integer link costs are handled here: a zero entry in a
+    sparse matrix means "no edge", and costs are reported back as ints.
+
+    Args:
+        graph: NetworkX graph representing the network topology
+
+    Returns:
+        Routing tables in the same shape as install_routes_for_all, or None
+        if the graph has link costs this path cannot represent.
+    """
+    names = list(graph.nodes)
+    index = {name: i for i, name in enumerate(names)}
+
+    rows, cols, costs = [], [], []
+    for a, b, cost in graph.edges(data="cost", default=1):
+        if type(cost) is not int or cost <= 0:
+            return None
+        rows.append(index[a])
+        cols.append(index[b])
+        costs.append(cost)
+
+    size = len(names)
+    matrix = csr_matrix((costs, (rows, cols)), shape=(size, size))
+    dist, pred = dijkstra(matrix, directed=False, return_predecessors=True)
+
+    tables = {}
+    for src in range(size):
+        dist_row = dist[src]
+        pred_row = pred[src].tolist()
+        next_hops = [-1] * size
+        routing_table = {}
+        # Settle destinations in order of distance so each predecessor's
+        # next hop is known before it is needed.
+        for dst in np.argsort(dist_row, kind="stable").tolist():
+            if dst == src:
+                continue
+            cost = dist_row[dst]
+            if cost == np.inf:
+                break
+            parent = pred_row[dst]
+            next_hop = dst if parent == src else next_hops[parent]
+            next_hops[dst] = next_hop
+            routing_table[names[dst]] = (names[next_hop], int(cost))
+        tables[names[src]] = routing_table
+
+    return tables
+
+
+# Per-process graph used by _spf_worker; set once by _init_spf_worker so the
+# edge list is pickled once per worker rather than once per task.
+_WORKER_GRAPH: Optional[nx.Graph] = None
+
+
+def _init_spf_worker(nodes: list, edges: list) -> None:
+    """Rebuilds the topology graph inside a worker process."""
+    global _WORKER_GRAPH
+    _WORKER_GRAPH = nx.Graph()
+    _WORKER_GRAPH.add_nodes_from(nodes)
+    _WORKER_GRAPH.add_edges_from(edges)
+
+
+def _spf_worker(start_node: str) -> Dict[str, Tuple[str, int]]:
+    """Runs SPF for one node against the worker's graph."""
+    return compute_spf_for_node(_WORKER_GRAPH, start_node)
+
+
+def install_routes_for_all(
+    graph: nx.Graph,
+    workers: int = 1
+) -> Dict[str, Dict[str, Tuple[str, int]]]:
     """
     Computes SPF for all nodes in the graph.
 
+    Uses a single all-pairs SciPy Dijkstra when SciPy is installed, and
+    falls back to one NetworkX Dijkstra per node otherwise. The per-node
+    fallback can be spread over a process pool for large fabrics.
+
     Args:
         graph: NetworkX graph representing the network topology
+        workers: Number of processes for the per-node fallback (default: 1,
+                 which runs in-process)
 
     Returns:
         Dictionary mapping each node to its routing table.
         Each routing table maps destination nodes to (next_hop, cost) tuples.
     """
-    return {node: compute_spf_for_node(graph, node) for node in graph.nodes}
+    if csr_matrix is not None:
+        tables = _install_routes_csgraph(graph)
+        if tables is not None:
+            return tables
+
+    nodes = list(graph.nodes)
+    if workers <= 1 or len(nodes) < 2:
+        return {node: compute_spf_for_node(graph, node) for node in nodes}
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_spf_worker,
+        initargs=(nodes, list(graph.edges(data=True))),
+    ) as executor:
+        chunksize = max(1, len(nodes) // (workers * 4))
+        tables = executor.map(_spf_worker, nodes, chunksize=chunksize)
+        return dict(zip(nodes, tables))
+
+
+def install_routes_spine_leaf(fabric: Fabric) -> Optional[Dict[str, Dict[str, Tuple[str, int]]]]:
+    """
+    Builds routing tables for a uniform-cost spine-leaf fabric in closed form.
+
+    In a full-mesh Clos where every spine links to every leaf at the same
+    cost, every spine-leaf route is one hop and every spine-spine or
+    leaf-leaf route is two hops, so no SPF run is needed. Two-hop routes use
+    the first spine (or leaf) in fabric order as the deterministic next hop.
+
+    Args:
+        fabric: Fabric whose nodes and links are inspected
+
+    Returns:
+        Routing tables in the same shape as install_routes_for_all, or None
+        if the fabric is not a uniform-cost full-mesh spine-leaf topology.
+    """
+    graph = fabric.graph
+    spines = [name for name, node in fabric.nodes.items() if node.role == "spine"]
+    leaves = [name for name, node in fabric.nodes.items() if node.role == "leaf"]
+    if len(spines) + len(leaves) != graph.number_of_nodes():
+        return None
+    if graph.number_of_edges() != len(spines) * len(leaves):
+        return None
+
+    # With the edge count fixed at spines * leaves, requiring every edge to
+    # join a spine and a leaf guarantees the mesh is complete.
+    cost = None
+    for a, b, link_cost in graph.edges(data="cost", default=1):
+        if fabric.nodes[a].role == fabric.nodes[b].role:
+            return None
+        if cost is None:
+            if link_cost <= 0:
+                return None
+            cost = link_cost
+        elif link_cost != cost:
+            return None
+
+    if cost is None:
+        return {name: {} for name in fabric.nodes}
+
+    tables = {}
+    for spine in spines:
+        table = {leaf: (leaf, cost) for leaf in leaves}
+        table.update((other, (leaves[0], 2 * cost)) for other in spines if other != spine)
+        tables[spine] = table
+    for leaf in leaves:
+        table = {spine: (spine, cost) for spine in spines}
+        table.update((other, (spines[0], 2 * cost)) for other in leaves if other != leaf)
+        tables[leaf] = table
+
+    return tables
 ```
\ No newline at end of file
@@ -0,0 +1,31 @@
+from __future__ import annotations
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson installed
+    orjson = None
+    import json
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize simulation output to UTF-8 encoded JSON bytes.
+
+    Uses orjson when it is installed and falls back to the stdlib json
+    module otherwise. Non-string dictionary keys (e.g. integer VNI IDs)
+    are accepted in both cases.
+
+    Args:
+        obj: JSON-compatible object to serialize
+        indent: Pretty-print with a two-space indent when True
+
+    Returns:
+        The JSON document as bytes
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+
+    return json.dumps(obj, indent=2 if indent else None).encode("utf-8")
@@ -1,6 +1,7 @@
 ```python
 from __future__ import annotations
-from typing import Dict, Optional, Any
+from functools import lru_cache
+from typing import Dict, Any
 from . import topology, ospf, vxlan
 
 
@@ -11,7 +12,7 @@ def build_demo_fabric() -> topology.Fabric:
     Returns:
         Fabric: The constructed fabric topology.
     """
-    fabric = topology.Fabric().build_spine_leaf(spines=2, leaves=3)
+    fabric = topology.Fabric().build_spine_leaf(spines=2, leaves=3).freeze()
     return fabric
 
 
@@ -35,23 +36,39 @@ def build_overlay(fabric: topology.Fabric) -> vxlan.VXLANOverlay:
         if node.role == "leaf" and node.vtep_ip:
             vx.attach_vtep(node=name, ip=node.vtep_ip, vnis=[10010])
     
+    vx.freeze()
     return vx
 
 
+@lru_cache(maxsize=1)
 def simulate() -> Dict[str, Any]:
     """
     Run a basic simulation with demo fabric and VXLAN overlay.
     
+    The simulation is deterministic, so the result is computed once and the
+    same dict is returned on later calls. Callers must treat it as read-only.
+    
+    Routes, VNIs and VTEPs are emitted as flat lists of records, e.g. one
+    {"node", "dest", "nexthop", "cost"} record per installed route.
+    
     Returns:
         Dict containing topology, routes, and VXLAN configuration.
     """
     # Build the fabric topology
     fabric = build_demo_fabric()
     
-    # Compute OSPF routes for all nodes
-    rtab = ospf.install_routes_for_all(fabric.graph)
-    for name, node in fabric.nodes.items():
-        node.routes = rtab[name]
+    # Compute OSPF routes for all nodes, skipping SPF for a uniform Clos
+    rtab = ospf.install_routes_spine_leaf(fabric)
+    if rtab is None:
+        rtab = ospf.install_routes_for_all(fabric.graph)
+
+    # Flatten all tables into one list of route records
+    routes = []
+    for node_name, route_table in rtab.items():
+        for dst, route in route_table.items():
+            routes.append(
+                {"node": node_name, "dest": dst, "nexthop": route[0], "cost": route[1]}
+            )
 
     # Build VXLAN overlay
     overlay = build_overlay(fabric)
@@ -61,30 +78,22 @@ def simulate() -> Dict[str, Any]:
     sample = None
     if tunnels:
         src_vtep, dst_vtep = tunnels[0]
-        src_vtep_obj = overlay.vteps[src_vtep]
-        dst_vtep_obj = overlay.vteps[dst_vtep]
-        sample = overlay.encapsulate(
-            src_vtep_obj, dst_vtep_obj, 10010, payload_desc="L2 frame: MAC A -> MAC B"
+        sample = overlay.encapsulate_by_name(
+            src_vtep, dst_vtep, 10010, payload_desc="L2 frame: MAC A -> MAC B"
         )
 
     result = {
         "topology": fabric.to_dict(),
-        "routes": {
-            node_name: {
-                dst: {"nexthop": nexthop, "cost": cost}
-                for dst, (nexthop, cost) in route_table.items()
-            }
-            for node_name, route_table in rtab.items()
-        },
+        "routes": routes,
         "vxlan": {
-            "vnis": {
-                vni_id: {"name": vni.name, "members": list(vni.members)}
+            "vnis": [
+                {"id": vni_id, "name": vni.name, "members": list(vni.members)}
                 for vni_id, vni in overlay.vnis.items()
-            },
-            "vteps": {
-                vtep_name: {"ip": vtep.ip, "vnis": list(vtep.vnis)}
+            ],
+            "vteps": [
+                {"name": vtep_name, "ip": vtep.ip, "vnis": list(vtep.vnis)}
                 for vtep_name, vtep in overlay.vteps.items()
-            },
+            ],
             "tunnels_vni_10010": tunnels,
             "sample_encapsulation": sample,
         },
@@ -92,69 +101,10 @@ def simulate() -> Dict[str, Any]:
     return result
 
 
-def run_full_simulation(
-    num_spines: int = 2,
-    num_leaves: int = 3,
-    vni_config: Optional[Dict[int, list]] = None
-) -> Dict[str, Any]:
-    """
-    Build the fabric, run OSPF, set up VXLAN, and return all results.
-    
-    Args:
-        num_spines: Number of spine switches to create.
-        num_leaves: Number of leaf switches to create.
-        vni_config: Dictionary mapping VNI IDs to lists of leaf names.
-                   If None, uses default configuration.
-    
-    Returns:
-        Dict containing topology, routing tables, VXLAN configuration, and tunnels.
-    """
-    if vni_config is None:
-        # Default VNI config: VNI 100 with all leaves, VNI 200 with a subset
-        vni_config = {
-            100: [f"leaf{i}" for i in range(1, num_leaves + 1)],
-            200: [f"leaf{i}" for i in range(1, max(2, (num_leaves // 2) + 1))],
-        }
-
-    # Build the fabric topology
-    fabric = topology.Fabric(num_spines, num_leaves)
-    
-    # Run OSPF to compute routing tables
-    routing_tables = ospf.compute_routing_tables(fabric)
-    
-    # Set up the VXLAN overlay
-    vteps, vnis = vxlan.setup_vxlan_overlay(fabric, vni_config)
-    
-    # Compute VXLAN tunnels based on underlay routes
-    tunnels = vxlan.compute_vxlan_tunnels(vnis, routing_tables)
-    
-    # Simulate a sample encapsulation
-    example_encap = None
-    if tunnels.get(100) and tunnels[100]:
-        # Find two VTEPs in VNI 100 to show an example
-        vtep1_name = tunnels[100][0]["from"]
-        vtep2_name = tunnels[100][0]["to"]
-        if vtep1_name in vteps and vtep2_name in vteps:
-            vtep1 = vteps[vtep1_name]
-            vtep2 = vteps[vtep2_name]
-            example_encap = vxlan.simulate_encapsulation(vtep1, vtep2, 100)
-
-    return {
-        "topology": fabric.get_topology(),
-        "routing_tables": routing_tables,
-        "vxlan_vteps": {
-            name: str(vtep.ip_address) for name, vtep in vteps.items()
-        },
-        "vxlan_vnis": {
-            vni_id: [member.name for member in vni.members]
-            for vni_id, vni in vnis.items()
-        },
-        "vxlan_tunnels": tunnels,
-        "example_encapsulation": example_encap,
-    }
-
-
 if __name__ == "__main__":
-    import json
-    print(json.dumps(simulate(), indent=2))
+    import sys
+    from .serialization import dumps
+
+    sys.stdout.buffer.write(dumps(simulate(), indent=True))
+    sys.stdout.buffer.write(b"\n")
 ```
\ No newline at end of file
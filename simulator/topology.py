@@ -1,11 +1,32 @@
 ```python
 from __future__ import annotations
+import sys
+from array import array
+from bisect import bisect_left
 from dataclasses import dataclass, field
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, Iterable, List, Sequence, Tuple, Optional
 import networkx as nx
 
 
-@dataclass
+def _cost_typecode(costs: Iterable[float]) -> str:
+    """Pick the narrowest array typecode that holds every cost exactly.
+    
+    Integer costs use a 32-bit array, or a 64-bit one if any cost does not
+    fit in 32 bits. Non-integer costs, and integers too wide for 64 bits,
+    fall back to double.
+    """
+    typecode = "i"
+    for cost in costs:
+        if not isinstance(cost, int):
+            return "d"
+        if not -2**31 <= cost < 2**31:
+            if not -2**63 <= cost < 2**63:
+                return "d"
+            typecode = "q"
+    return typecode
+
+
+@dataclass(slots=True)
 class Node:
     """Represents a network node in the fabric topology.
     
@@ -15,18 +36,66 @@ class Node:
         loopback: Loopback IP address for the node
         vtep_ip: VXLAN Tunnel Endpoint IP (only for leaf nodes)
         routes: Routing table mapping prefixes to (nexthop, cost) tuples
+        route_nexthop: Next-hop node index per destination node index, or -1
+        route_cost: Route cost per destination node index, or -1
+        route_names: Node names by index, shared with the owning fabric
+    
+    Fabric.install_routes fills the route arrays, indexed by
+    Fabric.node_index, instead of ``routes``; legacy_routes rebuilds the
+    dict form from them on demand.
     """
     name: str
     role: str  # 'spine' | 'leaf' | 'host'
     loopback: str
     vtep_ip: Optional[str] = None
     routes: Dict[str, Tuple[str, int]] = field(default_factory=dict)  # prefix -> (nexthop, cost)
+    route_nexthop: Optional[array] = field(default=None, repr=False)
+    route_cost: Optional[array] = field(default=None, repr=False)
+    route_names: Optional[List[str]] = field(default=None, repr=False)
+
+    def get_route(self, dst_idx: int) -> Tuple[int, int]:
+        """Look up the route to a destination by node index.
+        
+        Args:
+            dst_idx: Destination node index in the owning fabric
+            
+        Returns:
+            (nexthop_idx, cost) tuple; both are -1 if the destination is
+            unreachable
+            
+        Raises:
+            ValueError: If no routes have been installed on this node
+        """
+        if self.route_nexthop is None:
+            raise ValueError(f"No routes installed on {self.name}")
+        return self.route_nexthop[dst_idx], self.route_cost[dst_idx]
+
+    @property
+    def legacy_routes(self) -> Dict[str, Tuple[str, int]]:
+        """Build the installed routes as a destination -> (nexthop, cost) dict.
+        
+        Returns:
+            Routing table keyed by destination name, without unreachable
+            destinations
+            
+        Raises:
+            ValueError: If no routes have been installed on this node
+        """
+        if self.route_nexthop is None:
+            raise ValueError(f"No routes installed on {self.name}")
+        names = self.route_names
+        costs = self.route_cost
+        return {
+            names[dst_idx]: (names[nexthop_idx], costs[dst_idx])
+            for dst_idx, nexthop_idx in enumerate(self.route_nexthop)
+            if nexthop_idx >= 0
+        }
 
     def __repr__(self) -> str:
         return f"Node({self.name}, {self.role})"
 
 
-@dataclass
+@dataclass(slots=True)
 class Link:
     """Represents a bidirectional link between two nodes.
     
@@ -48,12 +117,32 @@ class Fabric:
     
     Uses NetworkX for graph operations and maintains a registry of nodes.
     Supports building spine-leaf topologies and querying topology properties.
+    
+    Once the topology is complete, freeze() builds a compressed sparse row
+    (CSR) snapshot of the adjacency that neighbors() and link_cost() read
+    from instead of the NetworkX dict-of-dicts. Adding nodes or links
+    through add_node(), add_link() or build_spine_leaf() discards the
+    snapshot. Changes made directly on ``graph`` are not detected: call
+    freeze() again after editing a frozen fabric's graph, or the snapshot
+    keeps serving the old adjacency.
     """
     
     def __init__(self) -> None:
         """Initialize an empty fabric topology."""
         self.graph: nx.Graph = nx.Graph()
         self.nodes: Dict[str, Node] = {}
+        # Links keyed by their sorted endpoint pair, mirroring the graph's edges
+        self._links: Dict[Tuple[str, str], Link] = {}
+        # CSR adjacency snapshot, populated by freeze(). The neighbors of
+        # node_names[i] are neighbors_idx[neighbors_ptr[i]:neighbors_ptr[i + 1]],
+        # sorted by index, with matching costs at the same positions in edge_cost.
+        self.node_names: List[str] = []
+        self.node_index: Dict[str, int] = {}
+        self.neighbors_ptr: Optional[array] = None
+        self.neighbors_idx: Optional[array] = None
+        self.edge_cost: Optional[array] = None
+        # Neighbor names per node, derived from the snapshot for neighbors()
+        self._adj: Dict[str, Tuple[str, ...]] = {}
 
     def add_node(self, node: Node) -> None:
         """Add a node to the fabric topology.
@@ -61,8 +150,10 @@ class Fabric:
         Args:
             node: Node instance to add
         """
+        node.name = sys.intern(node.name)
         self.nodes[node.name] = node
         self.graph.add_node(node.name)
+        self._thaw()
 
     def add_link(self, link: Link) -> None:
         """Add a link between two nodes in the fabric.
@@ -71,6 +162,13 @@ class Fabric:
             link: Link instance defining the connection
         """
         self.graph.add_edge(link.a, link.b, cost=link.cost)
+        self._links[self._link_key(link)] = link
+        self._thaw()
+
+    @staticmethod
+    def _link_key(link: Link) -> Tuple[str, str]:
+        """Return the order-independent registry key for a link."""
+        return (link.a, link.b) if link.a <= link.b else (link.b, link.a)
 
     def build_spine_leaf(self, spines: int = 2, leaves: int = 3) -> Fabric:
         """Build a standard spine-leaf topology with full-mesh connectivity.
@@ -87,44 +185,142 @@ class Fabric:
         Returns:
             Self for method chaining
         """
-        # Add spine nodes
-        for i in range(1, spines + 1):
-            name = f"S{i}"
-            loopback = f"10.255.0.{i}"
-            self.add_node(Node(name=name, role="spine", loopback=loopback))
-        
-        # Add leaf nodes with VTEP IPs
-        for i in range(1, leaves + 1):
-            idx = i + spines
-            name = f"L{i}"
-            loopback = f"10.255.0.{idx}"
-            vtep = f"10.0.0.{idx}"
-            self.add_node(Node(
-                name=name,
+        # Create spine nodes and leaf nodes with VTEP IPs
+        spine_nodes = [
+            Node(name=sys.intern(f"S{i}"), role="spine", loopback=f"10.255.0.{i}")
+            for i in range(1, spines + 1)
+        ]
+        leaf_nodes = [
+            Node(
+                name=sys.intern(f"L{i}"),
                 role="leaf",
-                loopback=loopback,
-                vtep_ip=vtep
-            ))
+                loopback=f"10.255.0.{i + spines}",
+                vtep_ip=f"10.0.0.{i + spines}"
+            )
+            for i in range(1, leaves + 1)
+        ]
+        new_nodes = spine_nodes + leaf_nodes
+        self.nodes.update((node.name, node) for node in new_nodes)
+        self.graph.add_nodes_from(node.name for node in new_nodes)
+        
+        # Create full-mesh connectivity between spines and leaves, inserting
+        # all edges into the graph in a single batch with a shared cost
+        links = [
+            Link(a=spine.name, b=leaf.name, cost=10)
+            for spine in spine_nodes
+            for leaf in leaf_nodes
+        ]
+        self.graph.add_edges_from(((link.a, link.b) for link in links), cost=10)
+        self._links.update((self._link_key(link), link) for link in links)
+        self._thaw()
+        
+        return self
+
+    def freeze(self) -> Fabric:
+        """Build a CSR snapshot of the adjacency for fast neighbor and cost lookups.
         
-        # Create full-mesh connectivity between spines and leaves
-        for si in range(1, spines + 1):
-            for li in range(1, leaves + 1):
-                self.add_link(Link(a=f"S{si}", b=f"L{li}", cost=10))
+        Nodes are numbered in graph order. Each node's neighbors are stored
+        contiguously, sorted by index, in flat arrays, and also cached as a
+        tuple of names. Edge costs are stored as integers unless some link
+        has a non-integer cost, in which case they are stored as doubles.
+        Call again after changing the topology; add_node and add_link drop
+        the snapshot.
         
+        Returns:
+            Self for method chaining
+        """
+        names = list(self.graph.nodes)
+        index = {name: i for i, name in enumerate(names)}
+        ptr = array("i", [0])
+        idx = array("i")
+        costs = []
+        for name in names:
+            adjacency = sorted(
+                (index[nbr], data["cost"]) for nbr, data in self.graph.adj[name].items()
+            )
+            for j, link_cost in adjacency:
+                idx.append(j)
+                costs.append(link_cost)
+            ptr.append(len(idx))
+        cost = array(_cost_typecode(costs), costs)
+
+        self.node_names = names
+        self.node_index = index
+        self.neighbors_ptr = ptr
+        self.neighbors_idx = idx
+        self.edge_cost = cost
+        self._adj = {
+            name: tuple(names[j] for j in idx[ptr[i]:ptr[i + 1]])
+            for i, name in enumerate(names)
+        }
         return self
 
-    def neighbors(self, node_name: str) -> List[str]:
+    def install_routes(self, tables: Dict[str, Dict[str, Tuple[str, int]]]) -> None:
+        """Store routing tables on their nodes as arrays.
+        
+        Each node gets ``route_nexthop``/``route_cost`` arrays indexed by
+        node_index; the tables themselves are not kept, and
+        Node.legacy_routes rebuilds them on demand. Route costs are stored
+        as 32-bit integers, as 64-bit integers if one does not fit, or as
+        doubles if any cost is not an integer.
+        
+        This calls freeze() first if the fabric has no current snapshot, so
+        node indices match the current topology.
+        
+        Args:
+            tables: Mapping of node name to its (nexthop, cost) routing table,
+                    as returned by the ospf module
+        """
+        if self.neighbors_ptr is None:
+            self.freeze()
+        index = self.node_index
+        unreachable = array("i", [-1]) * len(self.node_names)
+        cost_typecode = _cost_typecode(
+            cost for table in tables.values() for _, cost in table.values()
+        )
+
+        for name, table in tables.items():
+            node = self.nodes.get(name)
+            if node is None:
+                continue
+            nexthops = array("i", unreachable)
+            costs = array(cost_typecode, unreachable)
+            for dst, (nexthop, cost) in table.items():
+                dst_idx = index[dst]
+                nexthops[dst_idx] = index[nexthop]
+                costs[dst_idx] = cost
+            node.route_nexthop = nexthops
+            node.route_cost = costs
+            node.route_names = self.node_names
+
+    def _thaw(self) -> None:
+        """Discard the CSR snapshot after a topology change."""
+        if self.neighbors_ptr is not None:
+            self.node_names = []
+            self.node_index = {}
+            self.neighbors_ptr = None
+            self.neighbors_idx = None
+            self.edge_cost = None
+            self._adj = {}
+
+    def neighbors(self, node_name: str) -> Sequence[str]:
         """Get all neighboring nodes for a given node.
         
+        On a frozen fabric this returns the cached neighbor tuple without
+        allocating; otherwise a fresh list is built from the graph.
+        
         Args:
             node_name: Name of the node to query
             
         Returns:
-            List of neighbor node names
+            Sequence of neighbor node names
             
         Raises:
             nx.NetworkXError: If node_name is not in the graph
         """
+        adjacent = self._adj.get(node_name)
+        if adjacent is not None:
+            return adjacent
         return list(self.graph.neighbors(node_name))
 
     def link_cost(self, a: str, b: str) -> int:
@@ -135,11 +331,19 @@ class Fabric:
             b: Name of the second node
             
         Returns:
-            Link cost as an integer
+            Link cost, an integer unless the link was given a fractional cost
             
         Raises:
             KeyError: If the link does not exist
         """
+        if self.neighbors_ptr is not None:
+            i = self.node_index[a]
+            j = self.node_index[b]
+            lo, hi = self.neighbors_ptr[i], self.neighbors_ptr[i + 1]
+            pos = bisect_left(self.neighbors_idx, j, lo, hi)
+            if pos == hi or self.neighbors_idx[pos] != j:
+                raise KeyError(b)
+            return self.edge_cost[pos]
         return self.graph[a][b]["cost"]
 
     def to_dict(self) -> Dict:
@@ -164,8 +368,8 @@ class Fabric:
                 for node in self.nodes.values()
             ],
             "links": [
-                {"a": a, "b": b, "cost": data["cost"]}
-                for a, b, data in self.graph.edges(data=True)
+                {"a": link.a, "b": link.b, "cost": link.cost}
+                for link in self._links.values()
             ],
         }
 ```
\ No newline at end of file
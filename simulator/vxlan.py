@@ -1,10 +1,13 @@
 ```python
 from __future__ import annotations
+import itertools
+import sys
+from array import array
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, Iterator, List, Optional, Sequence, Set, Tuple
 
 
-@dataclass
+@dataclass(slots=True)
 class VTEP:
     """A VXLAN Tunnel End Point.
     
@@ -17,19 +20,82 @@ class VTEP:
     ip: str
     vnis: Set[int] = field(default_factory=set)
 
+    def __repr__(self) -> str:
+        return f"VTEP({self.name})"
 
-@dataclass
+
+@dataclass(slots=True)
 class VNI:
     """A VXLAN Network Identifier, representing a virtual L2 segment.
     
     Attributes:
         id: Unique VNI identifier (24-bit value in real VXLAN)
         name: Human-readable name for the VNI
-        members: Set of VTEP names that are members of this VNI
+        members: VTEP names that are members of this VNI, in join order
+                 (sorted once the VNI is frozen)
+    
+    Membership is deduplicated through a companion set while the VNI is
+    being built; freeze() sorts ``members`` in place and drops that set once
+    membership is settled. The sorted member tuple is cached for tunnel
+    enumeration. Add members through add_member(); code that mutates
+    ``members`` directly must reset ``_sorted`` to None. The VXLAN header
+    line, which depends only on the VNI ID, is formatted once at
+    construction.
     """
     id: int
     name: str
-    members: Set[str] = field(default_factory=set)
+    members: List[str] = field(default_factory=list)
+    _member_set: Optional[Set[str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _sorted: Optional[Tuple[str, ...]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _vxlan_header: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.members = list(dict.fromkeys(self.members))
+        self._member_set = set(self.members)
+        self._vxlan_header = f"VNI {self.id}"
+
+    @property
+    def frozen(self) -> bool:
+        """Whether membership has been settled by freeze()."""
+        return self._member_set is None
+
+    def add_member(self, vtep_name: str) -> None:
+        """Add a VTEP to this VNI, invalidating the sorted-member cache.
+        
+        Adding to a frozen VNI is allowed and unfreezes it.
+        
+        Args:
+            vtep_name: Name of the VTEP joining the VNI
+        """
+        if self._member_set is None:
+            self._member_set = set(self.members)
+        if vtep_name not in self._member_set:
+            self._member_set.add(vtep_name)
+            self.members.append(vtep_name)
+            self._sorted = None
+
+    def freeze(self) -> None:
+        """Sort the members in place and drop the deduplication set."""
+        self.members.sort()
+        self._sorted = tuple(self.members)
+        self._member_set = None
+
+    def sorted_members(self) -> Tuple[str, ...]:
+        """Return the member VTEP names in sorted order, cached until membership changes.
+        
+        Returns:
+            Tuple of member names sorted by name
+        """
+        if self._sorted is None:
+            self._sorted = tuple(sorted(self.members))
+        return self._sorted
+
+    def __repr__(self) -> str:
+        return f"VNI({self.id})"
 
 
 class VXLANOverlay:
@@ -43,16 +109,31 @@ class VXLANOverlay:
         """Initialize an empty VXLAN overlay network."""
         self.vnis: Dict[int, VNI] = {}
         self.vteps: Dict[str, VTEP] = {}
+        # Stable integer index per VTEP, in registration order; VNI members
+        # without a VTEP are numbered when tunnel indices are first requested
+        self._vtep_names: List[str] = []
+        self._vtep_index: Dict[str, int] = {}
+        # Outer IP header lines keyed by (source name, destination name) for
+        # every tunnel pair, built by freeze() for encapsulate_by_name()
+        self._name_lines: Dict[Tuple[str, str], str] = {}
+        # Tunnel lists of frozen VNIs, keyed by VNI ID and stored with the
+        # sorted-member tuple they were built from
+        self._tunnel_cache: Dict[int, Tuple[Tuple[str, ...], Tuple[Tuple[str, str], ...]]] = {}
 
-    def add_vni(self, vni_id: int, name: str) -> None:
+    def add_vni(self, vni_id: int, name: str) -> VNI:
         """Add a VNI to the overlay if it doesn't already exist.
         
         Args:
             vni_id: The VNI identifier (should be 0-16777215 for valid VXLAN)
             name: The VNI name
+            
+        Returns:
+            The new VNI, or the existing one if the ID was already present
         """
-        if vni_id not in self.vnis:
-            self.vnis[vni_id] = VNI(id=vni_id, name=name)
+        vni = self.vnis.get(vni_id)
+        if vni is None:
+            vni = self.vnis[vni_id] = VNI(id=vni_id, name=name)
+        return vni
 
     def attach_vtep(self, node: str, ip: str, vnis: List[int]) -> None:
         """Attach a VTEP to the overlay and associate it with VNIs.
@@ -66,19 +147,69 @@ class VXLANOverlay:
             ip: The VTEP IP address
             vnis: List of VNI IDs to associate with this VTEP
         """
-        if node not in self.vteps:
-            self.vteps[node] = VTEP(name=node, ip=ip)
-        else:
-            # Update IP address if VTEP already exists
-            self.vteps[node].ip = ip
+        # Intern the name so the VTEP registry and every VNI member set share
+        # one string object and lookups can hit the identity fast path
+        node = sys.intern(node)
+        vtep = self.vteps.get(node)
+        if vtep is None:
+            vtep = self.vteps[node] = VTEP(name=node, ip=ip)
+            if node not in self._vtep_index:
+                self._vtep_index[node] = len(self._vtep_names)
+                self._vtep_names.append(node)
+        elif vtep.ip != ip:
+            # Update IP address if VTEP already exists; lines formatted with
+            # the old address are rebuilt by the next freeze()
+            vtep.ip = ip
+            self._name_lines = {}
         
-        vtep = self.vteps[node]
+        known = self.vnis
         for vni_id in vnis:
             # Auto-create VNI if not present
-            self.add_vni(vni_id, f"VNI-{vni_id}")
-            self.vnis[vni_id].members.add(node)
+            vni = known.get(vni_id)
+            if vni is None:
+                vni = self.add_vni(vni_id, f"VNI-{vni_id}")
+            vni.add_member(node)
             vtep.vnis.add(vni_id)
 
+    def freeze(self) -> None:
+        """Freeze every VNI once overlay membership is settled.
+        
+        Members are sorted in place and the per-VNI deduplication sets are
+        released. The outer IP header line of every tunnel, in both
+        directions, is formatted once for encapsulate_by_name(). Attaching
+        VTEPs afterwards still works and unfreezes the affected VNIs;
+        changing a VTEP's IP drops the line table.
+        """
+        vteps = self.vteps
+        lines: Dict[Tuple[str, str], str] = {}
+        for vni in self.vnis.values():
+            vni.freeze()
+            members = [vteps[name] for name in vni.members if name in vteps]
+            for a, b in itertools.combinations(members, 2):
+                lines[a.name, b.name] = f"src={a.ip}, dst={b.ip}"
+                lines[b.name, a.name] = f"src={b.ip}, dst={a.ip}"
+        self._name_lines = lines
+
+    def iter_tunnels_for_vni(self, vni_id: int) -> Iterator[Tuple[str, str]]:
+        """Lazily yields all VTEP-to-VTEP tunnels for a given VNI.
+        
+        Produces the same pairs in the same order as tunnels_for_vni, one at a
+        time, for callers that consume the tunnels once and do not need them
+        all in memory.
+        
+        Args:
+            vni_id: The VNI identifier
+            
+        Yields:
+            Tuples representing VTEP pairs that form tunnels.
+            Yields nothing if VNI doesn't exist or has fewer than 2 members.
+        """
+        if vni_id not in self.vnis:
+            return
+        
+        # combinations() preserves the sorted order of its input
+        yield from itertools.combinations(self.vnis[vni_id].sorted_members(), 2)
+
     def tunnels_for_vni(self, vni_id: int) -> List[Tuple[str, str]]:
         """Returns all VTEP-to-VTEP tunnels for a given VNI.
         
@@ -93,15 +224,142 @@ class VXLANOverlay:
             List of tuples representing VTEP pairs that form tunnels.
             Returns empty list if VNI doesn't exist or has fewer than 2 members.
         """
+        return list(self.cached_tunnels_for_vni(vni_id))
+
+    def cached_tunnels_for_vni(self, vni_id: int) -> Sequence[Tuple[str, str]]:
+        """Returns the tunnels for a VNI as a shared tuple, without copying.
+        
+        Yields the same pairs as tunnels_for_vni. For a frozen VNI the tuple
+        is cached, so repeated calls return the same object in O(1) until
+        its membership changes.
+        
+        Args:
+            vni_id: The VNI identifier
+            
+        Returns:
+            Tuple of VTEP name pairs. Empty if the VNI doesn't exist or has
+            fewer than 2 members.
+        """
+        vni = self.vnis.get(vni_id)
+        if vni is None:
+            return ()
+        if not vni.frozen:
+            return tuple(itertools.combinations(vni.sorted_members(), 2))
+        
+        # Frozen membership is stable, so reuse the pairs until the sorted
+        # member tuple they were built from is replaced
+        members = vni.sorted_members()
+        cached = self._tunnel_cache.get(vni_id)
+        if cached is None or cached[0] is not members:
+            cached = self._tunnel_cache[vni_id] = (
+                members, tuple(itertools.combinations(members, 2))
+            )
+        return cached[1]
+
+    def invalidate_tunnels(self, vni_id: int) -> None:
+        """Drop the cached tunnel list for a VNI.
+        
+        Membership changes made through add_member() are picked up
+        automatically; call this after mutating a VNI's members directly.
+        
+        Args:
+            vni_id: The VNI identifier
+        """
+        self._tunnel_cache.pop(vni_id, None)
+        vni = self.vnis.get(vni_id)
+        if vni is not None:
+            vni._sorted = None
+
+    def tunnels_for_vni_indices(self, vni_id: int) -> array:
+        """Returns the tunnels for a VNI as packed pairs of VTEP indices.
+        
+        Each VTEP is numbered in registration order; vtep_name() maps an
+        index back to its name. Members added with VNI.add_member() that
+        were never attached as VTEPs are numbered after the VTEPs known so
+        far. Pairs are in the same order as tunnels_for_vni and are stored
+        flat, so tunnel ``p`` is ``(pairs[2 * p], pairs[2 * p + 1])``.
+        
+        Args:
+            vni_id: The VNI identifier
+            
+        Returns:
+            Flat int array of VTEP index pairs. Empty if the VNI doesn't exist
+            or has fewer than 2 members.
+        """
         if vni_id not in self.vnis:
-            return []
+            return array("i")
+        
+        members = self._member_indices(self.vnis[vni_id])
+        return array("i", itertools.chain.from_iterable(itertools.combinations(members, 2)))
+
+    def tunnels_for_all_vnis(self) -> Dict[int, List[Tuple[str, str]]]:
+        """Returns the tunnels of every VNI in one sweep.
+        
+        Returns:
+            Dictionary mapping each VNI ID, in ascending order, to its list of
+            VTEP name pairs as returned by tunnels_for_vni
+        """
+        return {
+            vni_id: list(itertools.combinations(self.vnis[vni_id].sorted_members(), 2))
+            for vni_id in sorted(self.vnis)
+        }
+
+    def tunnels_for_all_vnis_indices(self) -> Tuple[array, array, array, List[str]]:
+        """Returns the tunnels of every VNI as one packed, CSR-style table.
+        
+        VNIs are taken in ascending ID order. The tunnels of ``vni_ids[k]``
+        are pairs ``offsets[k]`` up to ``offsets[k + 1]`` of ``pairs``, where
+        pair ``p`` is ``(pairs[2 * p], pairs[2 * p + 1])`` and each entry
+        indexes ``names``.
+        
+        Returns:
+            Tuple of (vni_ids, offsets, pairs, names)
+        """
+        vni_ids = array("i")
+        offsets = array("i", [0])
+        pairs = array("i")
+        for vni_id in sorted(self.vnis):
+            members = self._member_indices(self.vnis[vni_id])
+            pairs.extend(itertools.chain.from_iterable(itertools.combinations(members, 2)))
+            vni_ids.append(vni_id)
+            offsets.append(len(pairs) // 2)
+        return vni_ids, offsets, pairs, list(self._vtep_names)
+
+    def _member_indices(self, vni: VNI) -> List[int]:
+        """Map a VNI's sorted members to their indices, numbering any new names.
         
-        members = sorted(self.vnis[vni_id].members)
-        tunnels = []
-        for i in range(len(members)):
-            for j in range(i + 1, len(members)):
-                tunnels.append((members[i], members[j]))
-        return tunnels
+        Args:
+            vni: The VNI whose members to index
+            
+        Returns:
+            Member indices in sorted-name order
+        """
+        index = self._vtep_index
+        members = vni.sorted_members()
+        try:
+            return [index[name] for name in members]
+        except KeyError:
+            for name in members:
+                if name not in index:
+                    index[name] = len(self._vtep_names)
+                    self._vtep_names.append(name)
+            return [index[name] for name in members]
+
+    def vtep_name(self, index: int) -> str:
+        """Return the member name with the given tunnel index.
+        
+        Indices cover attached VTEPs and also VNI members that were never
+        attached, which the index-based tunnel queries number on demand. An
+        index may therefore name a member with no entry in ``vteps``; use
+        get_vtep() to tell the two apart.
+        
+        Args:
+            index: Member index as used by tunnels_for_vni_indices
+            
+        Returns:
+            The member name
+        """
+        return self._vtep_names[index]
 
     def encapsulate(
         self, 
@@ -126,14 +384,55 @@ class VXLANOverlay:
             Dictionary representing the encapsulated packet structure with
             payload, VXLAN header, UDP header, and outer IP header.
         """
+        # Reuse the VXLAN header line formatted when the VNI was created
+        vni = self.vnis.get(vni_id)
         return {
             "description": "VXLAN Encapsulation",
             "payload": payload_desc,
-            "vxlan_header": f"VNI {vni_id}",
+            "vxlan_header": vni._vxlan_header if vni is not None else f"VNI {vni_id}",
             "outer_udp_header": "UDP Port 4789",
             "outer_ip_header": f"src={vtep_a.ip}, dst={vtep_b.ip}",
         }
 
+    def encapsulate_by_name(
+        self,
+        a_name: str,
+        b_name: str,
+        vni_id: int,
+        payload_desc: str
+    ) -> Dict[str, str]:
+        """Simulates VXLAN encapsulation between two attached VTEPs by name.
+        
+        Equivalent to encapsulate() but takes VTEP names. Once the overlay is
+        frozen, the outer IP header line of each tunnel pair is read from a
+        table keyed by the two names; other pairs are formatted on the fly.
+        
+        Args:
+            a_name: Name of the source VTEP
+            b_name: Name of the destination VTEP
+            vni_id: VNI identifier for the encapsulation
+            payload_desc: Description of the payload being encapsulated
+            
+        Returns:
+            Dictionary representing the encapsulated packet structure
+            
+        Raises:
+            KeyError: If either VTEP is not attached to the overlay
+        """
+        vni = self.vnis.get(vni_id)
+        try:
+            line = self._name_lines[a_name, b_name]
+        except KeyError:
+            vteps = self.vteps
+            line = f"src={vteps[a_name].ip}, dst={vteps[b_name].ip}"
+        return {
+            "description": "VXLAN Encapsulation",
+            "payload": payload_desc,
+            "vxlan_header": vni._vxlan_header if vni is not None else f"VNI {vni_id}",
+            "outer_udp_header": "UDP Port 4789",
+            "outer_ip_header": line,
+        }
+
     def get_vtep(self, name: str) -> Optional[VTEP]:
         """Retrieve a VTEP by name.
         
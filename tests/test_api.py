@@ -0,0 +1,53 @@
+import gzip
+import json
+
+import pytest
+from simulator import api
+
+
+@pytest.fixture
+def client():
+    return api.app.test_client()
+
+
+@pytest.mark.parametrize("path", ["/", "/api/topology", "/api/routes", "/api/vxlan"])
+def test_responses_are_cacheable(client, path):
+    """
+    Verifies that every endpoint answers 200 with a weak ETag and public
+    Cache-Control, and that If-None-Match yields an empty 304 with or
+    without gzip negotiation.
+    """
+    response = client.get(path)
+    assert response.status_code == 200
+    assert response.headers["ETag"].startswith('W/"')
+    assert response.cache_control.public
+    assert response.cache_control.max_age == api.CACHE_MAX_AGE
+
+    etag = response.headers["ETag"]
+    for headers in ({}, {"Accept-Encoding": "gzip"}):
+        revalidated = client.get(path, headers={"If-None-Match": etag, **headers})
+        assert revalidated.status_code == 304
+        assert revalidated.get_data() == b""
+        assert revalidated.headers["ETag"] == etag
+
+
+def test_routes_body_is_valid_json(client):
+    """
+    Verifies that the routes body decodes to the simulation's route
+    records, both plain and gzip-encoded.
+    """
+    expected = json.loads(json.dumps(api.simulate.simulate()["routes"]))
+
+    plain = client.get("/api/routes")
+    assert plain.mimetype == "application/json"
+    assert plain.content_length == len(plain.get_data())
+    assert json.loads(plain.get_data()) == expected
+
+    compressed = client.get("/api/routes", headers={"Accept-Encoding": "gzip"})
+    body = compressed.get_data()
+    if compressed.headers.get("Content-Encoding") == "gzip":
+        body = gzip.decompress(body)
+    else:
+        # Bodies below the size threshold are sent uncompressed
+        assert api.Compress is None or len(body) < api.app.config["COMPRESS_MIN_SIZE"]
+    assert json.loads(body) == expected
@@ -28,4 +28,63 @@ def test_spf_costs_and_paths():
 
     # Symmetric paths: cost from L1 to L2 equals cost from L2 to L1
     assert rtab["L1"]["L2"][1] == rtab["L2"]["L1"][1], "Paths should be symmetric"
+
+
+def test_all_pairs_matches_per_node_spf():
+    """
+    Checks install_routes_for_all against compute_spf_for_node on a fabric
+    with uneven link costs and an unreachable node.
+    """
+    fab = topology.Fabric().build_spine_leaf(spines=2, leaves=3)
+    fab.add_link(topology.Link(a="S1", b="L1", cost=5))
+    fab.add_link(topology.Link(a="S2", b="L3", cost=30))
+    fab.add_node(topology.Node(name="X1", role="host", loopback="10.255.0.99"))
+
+    rtab = ospf.install_routes_for_all(fab.graph)
+
+    assert rtab["X1"] == {}
+    for node in fab.graph.nodes:
+        expected = ospf.compute_spf_for_node(fab.graph, node)
+        assert set(rtab[node]) == set(expected)
+        for dest, (nexthop, cost) in rtab[node].items():
+            assert cost == expected[dest][1]
+            # The next hop must be a neighbor on a shortest path
+            assert nexthop in fab.neighbors(node)
+            remaining = 0 if nexthop == dest else rtab[nexthop][dest][1]
+            assert fab.link_cost(node, nexthop) + remaining == cost
+
+
+def test_spine_leaf_closed_form_matches_spf():
+    """
+    Checks the closed-form spine-leaf routes against SPF, and that fabrics
+    which are not uniform full meshes are rejected.
+    """
+    fab = topology.Fabric().build_spine_leaf(spines=3, leaves=4)
+    closed = ospf.install_routes_spine_leaf(fab)
+    rtab = ospf.install_routes_for_all(fab.graph)
+
+    assert set(closed) == set(rtab)
+    for node, table in closed.items():
+        assert {dest: cost for dest, (_, cost) in table.items()} == {
+            dest: cost for dest, (_, cost) in rtab[node].items()
+        }
+    assert closed["L1"]["L2"] == ("S1", 20)
+    assert closed["S2"]["S3"] == ("L1", 20)
+
+    fab.add_link(topology.Link(a="S1", b="L1", cost=5))
+    assert ospf.install_routes_spine_leaf(fab) is None
+
+
+def test_parallel_spf_matches_serial(monkeypatch):
+    """
+    Checks that the process-pool fallback produces the same tables as the
+    in-process per-node SPF.
+    """
+    monkeypatch.setattr(ospf, "csr_matrix", None)
+    fab = topology.Fabric().build_spine_leaf(spines=2, leaves=4)
+
+    serial = ospf.install_routes_for_all(fab.graph)
+    parallel = ospf.install_routes_for_all(fab.graph, workers=2)
+
+    assert parallel == serial
 ```
\ No newline at end of file
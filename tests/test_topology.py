@@ -0,0 +1,99 @@
+import pytest
+from simulator import ospf, topology
+
+
+def test_frozen_lookups_match_graph():
+    """
+    Verifies that neighbor and link-cost lookups served from the CSR
+    snapshot agree with the NetworkX graph, and that topology changes
+    discard the snapshot.
+    """
+    fab = topology.Fabric().build_spine_leaf(spines=2, leaves=3)
+    fab.add_link(topology.Link(a="S1", b="L2", cost=7))
+    expected = {
+        node: {nbr: fab.link_cost(node, nbr) for nbr in fab.neighbors(node)}
+        for node in fab.graph.nodes
+    }
+
+    fab.freeze()
+    for node, costs in expected.items():
+        assert sorted(fab.neighbors(node)) == sorted(costs)
+        for nbr, cost in costs.items():
+            assert fab.link_cost(node, nbr) == cost
+
+    # Spines are not linked to each other
+    with pytest.raises(KeyError):
+        fab.link_cost("S1", "S2")
+
+    fab.add_link(topology.Link(a="S1", b="S2", cost=3))
+    assert fab.neighbors_ptr is None
+    assert fab.link_cost("S1", "S2") == 3
+
+
+def test_freeze_keeps_fractional_link_costs():
+    """
+    Verifies that a non-integer link cost survives the CSR snapshot.
+    """
+    fab = topology.Fabric().build_spine_leaf(spines=2, leaves=2)
+    fab.add_link(topology.Link(a="S1", b="L1", cost=2.5))
+
+    fab.freeze()
+    assert fab.link_cost("S1", "L1") == 2.5
+    assert fab.link_cost("L1", "S1") == 2.5
+    assert fab.link_cost("S2", "L2") == 10
+
+    # Integer costs beyond 32 bits are kept exactly
+    fab.add_link(topology.Link(a="S2", b="L1", cost=2**40))
+    fab.freeze()
+    assert fab.link_cost("L1", "S2") == 2**40
+
+
+def test_install_routes_fills_route_arrays():
+    """
+    Verifies that installed route arrays agree with the routing tables.
+    """
+    fab = topology.Fabric().build_spine_leaf(spines=2, leaves=2)
+    fab.add_node(topology.Node(name="X1", role="host", loopback="10.255.0.99"))
+    rtab = ospf.install_routes_for_all(fab.graph)
+
+    fab.install_routes(rtab)
+
+    index = fab.node_index
+    for name, table in rtab.items():
+        node = fab.nodes[name]
+        assert node.legacy_routes == table
+        for dst, (nexthop, cost) in table.items():
+            assert node.get_route(index[dst]) == (index[nexthop], cost)
+    assert fab.nodes["L1"].get_route(index["X1"]) == (-1, -1)
+
+
+def test_install_routes_with_fractional_costs():
+    """
+    Verifies that routes over a link with a non-integer cost install and
+    keep their fractional costs.
+    """
+    fab = topology.Fabric().build_spine_leaf(spines=2, leaves=2)
+    fab.add_link(topology.Link(a="S1", b="L1", cost=2.5))
+    rtab = ospf.install_routes_for_all(fab.graph)
+
+    fab.install_routes(rtab)
+
+    index = fab.node_index
+    assert fab.nodes["L1"].get_route(index["S1"]) == (index["S1"], 2.5)
+    assert fab.nodes["S1"].get_route(index["L2"]) == (index["L2"], 10)
+
+
+def test_install_routes_with_wide_integer_costs():
+    """
+    Verifies that route costs beyond 32 bits install without overflow.
+    """
+    fab = topology.Fabric().build_spine_leaf(spines=1, leaves=2)
+    for leaf in ("L1", "L2"):
+        fab.add_link(topology.Link(a="S1", b=leaf, cost=2**30))
+    rtab = ospf.install_routes_for_all(fab.graph)
+
+    fab.install_routes(rtab)
+
+    index = fab.node_index
+    assert fab.nodes["L1"].get_route(index["L2"]) == (index["S1"], 2**31)
+    assert fab.nodes["L1"].legacy_routes == rtab["L1"]
@@ -0,0 +1,152 @@
+from simulator import vxlan
+
+
+def test_tunnels_follow_membership_changes():
+    """
+    Verifies tunnel enumeration order and that the cached sorted member
+    list is refreshed when a VTEP joins a VNI.
+    """
+    overlay = vxlan.VXLANOverlay()
+    overlay.attach_vtep(node="L3", ip="10.0.0.5", vnis=[10010])
+    overlay.attach_vtep(node="L1", ip="10.0.0.3", vnis=[10010])
+
+    assert overlay.tunnels_for_vni(10010) == [("L1", "L3")]
+
+    overlay.attach_vtep(node="L2", ip="10.0.0.4", vnis=[10010])
+    assert overlay.tunnels_for_vni(10010) == [("L1", "L2"), ("L1", "L3"), ("L2", "L3")]
+
+    # Unknown VNIs have no tunnels
+    assert overlay.tunnels_for_vni(20020) == []
+
+
+def test_tunnel_indices_match_names():
+    """
+    Verifies that packed index pairs decode to the same tunnels, in the
+    same order, as the name-based enumeration.
+    """
+    overlay = vxlan.VXLANOverlay()
+    for i, name in enumerate(["L4", "L2", "L3", "L1"]):
+        overlay.attach_vtep(node=name, ip=f"10.0.0.{i + 1}", vnis=[10010])
+
+    pairs = overlay.tunnels_for_vni_indices(10010)
+    decoded = [
+        (overlay.vtep_name(pairs[k]), overlay.vtep_name(pairs[k + 1]))
+        for k in range(0, len(pairs), 2)
+    ]
+
+    assert decoded == overlay.tunnels_for_vni(10010)
+    assert len(overlay.tunnels_for_vni_indices(20020)) == 0
+
+    # Members added without attaching a VTEP are indexed too
+    overlay.get_vni(10010).add_member("L0")
+    pairs = overlay.tunnels_for_vni_indices(10010)
+    decoded = [
+        (overlay.vtep_name(pairs[k]), overlay.vtep_name(pairs[k + 1]))
+        for k in range(0, len(pairs), 2)
+    ]
+    assert decoded == overlay.tunnels_for_vni(10010)
+    _, _, all_pairs, names = overlay.tunnels_for_all_vnis_indices()
+    assert [names[i] for i in all_pairs] == [name for pair in decoded for name in pair]
+
+    # Attaching the member later keeps its index
+    overlay.attach_vtep(node="L0", ip="10.0.0.9", vnis=[10010])
+    assert overlay.tunnels_for_vni_indices(10010) == pairs
+
+
+def test_all_vni_tunnel_table_matches_per_vni():
+    """
+    Verifies that the batched tunnel table agrees with per-VNI enumeration.
+    """
+    overlay = vxlan.VXLANOverlay()
+    overlay.attach_vtep(node="L1", ip="10.0.0.3", vnis=[200, 100])
+    overlay.attach_vtep(node="L2", ip="10.0.0.4", vnis=[100])
+    overlay.attach_vtep(node="L3", ip="10.0.0.5", vnis=[100, 200, 300])
+
+    by_vni = overlay.tunnels_for_all_vnis()
+    assert list(by_vni) == [100, 200, 300]
+
+    vni_ids, offsets, pairs, names = overlay.tunnels_for_all_vnis_indices()
+    assert list(vni_ids) == [100, 200, 300]
+    for k, vni_id in enumerate(vni_ids):
+        decoded = [
+            (names[pairs[2 * p]], names[pairs[2 * p + 1]])
+            for p in range(offsets[k], offsets[k + 1])
+        ]
+        assert decoded == by_vni[vni_id] == overlay.tunnels_for_vni(vni_id)
+
+
+def test_freeze_sorts_members_and_allows_rejoin():
+    """
+    Verifies that freezing sorts VNI members and that later joins unfreeze
+    the VNI without creating duplicates.
+    """
+    overlay = vxlan.VXLANOverlay()
+    overlay.attach_vtep(node="L2", ip="10.0.0.4", vnis=[10010])
+    overlay.attach_vtep(node="L1", ip="10.0.0.3", vnis=[10010])
+    overlay.freeze()
+
+    vni = overlay.get_vni(10010)
+    assert vni.frozen
+    assert vni.members == ["L1", "L2"]
+
+    overlay.attach_vtep(node="L1", ip="10.0.0.3", vnis=[10010])
+    overlay.attach_vtep(node="L0", ip="10.0.0.2", vnis=[10010])
+    assert not vni.frozen
+    assert vni.members == ["L1", "L2", "L0"]
+    assert overlay.tunnels_for_vni(10010) == [("L0", "L1"), ("L0", "L2"), ("L1", "L2")]
+
+
+def test_encapsulate_by_name_matches_encapsulate():
+    """
+    Verifies that name-based encapsulation produces the same packet as the
+    VTEP-object form.
+    """
+    overlay = vxlan.VXLANOverlay()
+    overlay.attach_vtep(node="L1", ip="10.0.0.3", vnis=[10010])
+    overlay.attach_vtep(node="L2", ip="10.0.0.4", vnis=[10010])
+
+    by_object = overlay.encapsulate(
+        overlay.vteps["L1"], overlay.vteps["L2"], 10010, payload_desc="frame"
+    )
+    assert overlay.encapsulate_by_name("L1", "L2", 10010, payload_desc="frame") == by_object
+    assert by_object["outer_ip_header"] == "src=10.0.0.3, dst=10.0.0.4"
+
+    # Frozen overlays read the line from the pair table in either direction,
+    # and an IP change is reflected before and after the next freeze
+    overlay.freeze()
+    assert overlay.encapsulate_by_name("L1", "L2", 10010, payload_desc="frame") == by_object
+    reverse = overlay.encapsulate_by_name("L2", "L1", 10010, payload_desc="frame")
+    assert reverse["outer_ip_header"] == "src=10.0.0.4, dst=10.0.0.3"
+
+    overlay.attach_vtep(node="L2", ip="10.0.0.40", vnis=[10010])
+    moved = overlay.encapsulate_by_name("L1", "L2", 10010, payload_desc="frame")
+    assert moved["outer_ip_header"] == "src=10.0.0.3, dst=10.0.0.40"
+    overlay.freeze()
+    assert overlay.encapsulate_by_name("L1", "L2", 10010, payload_desc="frame") == moved
+
+
+def test_frozen_tunnels_are_cached_until_membership_changes():
+    """
+    Verifies that tunnels of a frozen VNI are reused and refreshed once its
+    membership changes, including direct mutation followed by invalidation.
+    """
+    overlay = vxlan.VXLANOverlay()
+    overlay.attach_vtep(node="L1", ip="10.0.0.3", vnis=[10010])
+    overlay.attach_vtep(node="L2", ip="10.0.0.4", vnis=[10010])
+    overlay.freeze()
+
+    first = overlay.tunnels_for_vni(10010)
+    assert first == [("L1", "L2")]
+    first.append(("X", "Y"))
+    assert overlay.tunnels_for_vni(10010) == [("L1", "L2")]
+    shared = overlay.cached_tunnels_for_vni(10010)
+    assert shared == (("L1", "L2"),)
+    assert overlay.cached_tunnels_for_vni(10010) is shared
+
+    overlay.attach_vtep(node="L3", ip="10.0.0.5", vnis=[10010])
+    overlay.freeze()
+    assert overlay.tunnels_for_vni(10010) == [("L1", "L2"), ("L1", "L3"), ("L2", "L3")]
+
+    overlay.get_vni(10010).members.remove("L2")
+    overlay.invalidate_tunnels(10010)
+    assert overlay.tunnels_for_vni(10010) == [("L1", "L3")]